@@ -14,7 +14,6 @@ args.output_dir/
 """
 
 import os
-import json
 from argparse import ArgumentParser
 from knowledge_storm.collaborative_storm.engine import (
     CollaborativeStormLMConfigs,
@@ -35,12 +34,13 @@ from knowledge_storm.rm import (
     TavilySearchRM,
     SearXNG,
 )
-from knowledge_storm.utils import load_api_key
+from knowledge_storm.utils import FileIOHelper, load_api_key
 
 
 def main(args):
     load_api_key(toml_file_path="secrets.toml")
     lm_config: CollaborativeStormLMConfigs = CollaborativeStormLMConfigs()
+    openai_api_type = os.getenv("OPENAI_API_TYPE")
     openai_kwargs = (
         {
             "api_key": os.getenv("OPENAI_API_KEY"),
@@ -49,7 +49,7 @@ def main(args):
             "top_p": 0.9,
             "api_base": None,
         }
-        if os.getenv("OPENAI_API_TYPE") == "openai"
+        if openai_api_type == "openai"
         else {
             "api_key": os.getenv("AZURE_API_KEY"),
             "temperature": 1.0,
@@ -59,16 +59,11 @@ def main(args):
         }
     )
 
-    ModelClass = (
-        OpenAIModel if os.getenv("OPENAI_API_TYPE") == "openai" else AzureOpenAIModel
-    )
+    ModelClass = OpenAIModel if openai_api_type == "openai" else AzureOpenAIModel
     # If you are using Azure service, make sure the model name matches your own deployed model name.
     # The default name here is only used for demonstration and may not match your case.
     gpt_4o_mini_model_name = "gpt-4o-mini"
     gpt_4o_model_name = "gpt-4o"
-    if os.getenv("OPENAI_API_TYPE") == "azure":
-        openai_kwargs["api_base"] = os.getenv("AZURE_API_BASE")
-        openai_kwargs["api_version"] = os.getenv("AZURE_API_VERSION")
 
     # STORM is a LM system so different components can be powered by different models.
     # For a good balance between cost and quality, you can choose a cheaper/faster model for conv_simulator_lm
@@ -204,13 +199,15 @@ def main(args):
 
     # Save instance dump
     instance_copy = costorm_runner.to_dict()
-    with open(os.path.join(args.output_dir, "instance_dump.json"), "w") as f:
-        json.dump(instance_copy, f, indent=2)
+    FileIOHelper.dump_json(
+        instance_copy, os.path.join(args.output_dir, "instance_dump.json"), indent=2
+    )
 
     # Save logging
     log_dump = costorm_runner.dump_logging_and_reset()
-    with open(os.path.join(args.output_dir, "log.json"), "w") as f:
-        json.dump(log_dump, f, indent=2)
+    FileIOHelper.dump_json(
+        log_dump, os.path.join(args.output_dir, "log.json"), indent=2
+    )
 
 
 if __name__ == "__main__":
@@ -39,6 +39,9 @@ from knowledge_storm.rm import (
 )
 from knowledge_storm.utils import load_api_key
 
+# Any character that isn't alphanumeric, underscore, or hyphen
+_INVALID_TOPIC_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 def sanitize_topic(topic):
     """
@@ -49,7 +52,7 @@ def sanitize_topic(topic):
     topic = topic.replace(" ", "_")
 
     # Remove any character that isn't alphanumeric, underscore, or hyphen
-    topic = re.sub(r"[^a-zA-Z0-9_-]", "", topic)
+    topic = _INVALID_TOPIC_CHARS_PATTERN.sub("", topic)
 
     # Ensure the topic isn't empty after sanitization
     if not topic:
@@ -146,23 +149,31 @@ def main(args):
 
     runner = STORMWikiRunner(engine_args, lm_configs, rm)
 
-    topic = input("Topic: ")
-    sanitized_topic = sanitize_topic(topic)
+    topics = list(args.topic or [])
+    if args.topics_file:
+        with open(args.topics_file) as f:
+            topics.extend(line.strip() for line in f if line.strip())
+    if not topics:
+        topics = [input("Topic: ")]
 
-    try:
-        runner.run(
-            topic=sanitized_topic,
-            do_research=args.do_research,
-            do_generate_outline=args.do_generate_outline,
-            do_generate_article=args.do_generate_article,
-            do_polish_article=args.do_polish_article,
-            remove_duplicate=args.remove_duplicate,
-        )
-        runner.post_run()
-        runner.summary()
-    except Exception as e:
-        logger.exception(f"An error occurred: {str(e)}")
-        raise
+    for topic in topics:
+        sanitized_topic = sanitize_topic(topic)
+
+        try:
+            runner.run(
+                topic=sanitized_topic,
+                do_research=args.do_research,
+                do_generate_outline=args.do_generate_outline,
+                do_generate_article=args.do_generate_article,
+                do_polish_article=args.do_polish_article,
+                remove_duplicate=args.remove_duplicate,
+            )
+            runner.post_run()
+            runner.summary()
+            runner.reset()
+        except Exception as e:
+            logger.exception("An error occurred: %s", e)
+            raise
 
 
 if __name__ == "__main__":
@@ -174,6 +185,20 @@ if __name__ == "__main__":
         default="./results/deepseek",
         help="Directory to store the outputs.",
     )
+    parser.add_argument(
+        "--topic",
+        type=str,
+        action="append",
+        default=None,
+        help="Topic to write about. Can be repeated to run several topics in one process, reusing the loaded "
+        "models and clients. If neither --topic nor --topics-file is given, the topic is read from stdin.",
+    )
+    parser.add_argument(
+        "--topics-file",
+        type=str,
+        default=None,
+        help="Path to a text file with one topic per line to run in addition to --topic.",
+    )
     parser.add_argument(
         "--max-thread-num",
         type=int,
@@ -28,6 +28,7 @@ args.output_dir/
 
 import os
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 
 from knowledge_storm import (
     STORMWikiRunnerArguments,
@@ -45,24 +46,23 @@ def main(args):
 
     # Initialize the language model configurations
     engine_lm_configs = STORMWikiLMConfigs()
+    openai_api_type = os.getenv("OPENAI_API_TYPE")
     openai_kwargs = {
         "api_key": os.getenv("OPENAI_API_KEY"),
         "temperature": 1.0,
         "top_p": 0.9,
     }
+    if openai_api_type == "azure":
+        openai_kwargs["api_base"] = os.getenv("AZURE_API_BASE")
+        openai_kwargs["api_version"] = os.getenv("AZURE_API_VERSION")
 
-    ModelClass = (
-        OpenAIModel if os.getenv("OPENAI_API_TYPE") == "openai" else AzureOpenAIModel
-    )
+    ModelClass = OpenAIModel if openai_api_type == "openai" else AzureOpenAIModel
     # If you are using Azure service, make sure the model name matches your own deployed model name.
     # The default name here is only used for demonstration and may not match your case.
     gpt_35_model_name = (
-        "gpt-3.5-turbo" if os.getenv("OPENAI_API_TYPE") == "openai" else "gpt-35-turbo"
+        "gpt-3.5-turbo" if openai_api_type == "openai" else "gpt-35-turbo"
     )
     gpt_4_model_name = "gpt-4o"
-    if os.getenv("OPENAI_API_TYPE") == "azure":
-        openai_kwargs["api_base"] = os.getenv("AZURE_API_BASE")
-        openai_kwargs["api_version"] = os.getenv("AZURE_API_VERSION")
 
     # STORM is a LM system so different components can be powered by different models.
     # For a good balance between cost and quality, you can choose a cheaper/faster model for conv_simulator_lm
@@ -109,6 +109,11 @@ def main(args):
             "collection_name": args.collection_name,
             "embedding_model": args.embedding_model,
             "device": args.device,
+            "embedding_backend": args.embedding_backend,
+            "embedding_cache_path": args.embedding_cache_path,
+            "quantization": None if args.quantization == "none" else args.quantization,
+            "on_disk": args.on_disk_vectors,
+            "float16": args.float16_vectors,
         }
         if args.vector_db_mode == "offline":
             QdrantVectorStoreManager.create_or_update_vector_store(
@@ -121,36 +126,53 @@ def main(args):
                 **kwargs
             )
 
-    # Setup VectorRM to retrieve information from your own data
-    rm = VectorRM(
-        collection_name=args.collection_name,
-        embedding_model=args.embedding_model,
-        device=args.device,
-        k=engine_args.search_top_k,
-    )
-
-    # initialize the vector store, either online (store the db on Qdrant server) or offline (store the db locally):
-    if args.vector_db_mode == "offline":
-        rm.init_offline_vector_db(vector_store_path=args.offline_vector_db_dir)
-    elif args.vector_db_mode == "online":
-        rm.init_online_vector_db(
-            url=args.online_vector_db_url, api_key=os.getenv("QDRANT_API_KEY")
+    def build_rm():
+        # Setup VectorRM to retrieve information from your own data
+        rm = VectorRM(
+            collection_name=args.collection_name,
+            embedding_model=args.embedding_model,
+            device=args.device,
+            k=engine_args.search_top_k,
+            embedding_backend=args.embedding_backend,
         )
 
+        # initialize the vector store, either online (store the db on Qdrant server) or offline (store the db locally):
+        if args.vector_db_mode == "offline":
+            rm.init_offline_vector_db(vector_store_path=args.offline_vector_db_dir)
+        elif args.vector_db_mode == "online":
+            rm.init_online_vector_db(
+                url=args.online_vector_db_url, api_key=os.getenv("QDRANT_API_KEY")
+            )
+        rm.warm_up()
+        return rm
+
+    topics = list(args.topic or [])
+    if args.topics_file:
+        with open(args.topics_file) as f:
+            topics.extend(line.strip() for line in f if line.strip())
+
+    # Load the embedding model and open the vector store while waiting for the user to enter the topic.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        rm_future = executor.submit(build_rm)
+        if not topics:
+            topics = [input("Topic: ")]
+        rm = rm_future.result()
+
     # Initialize the STORM Wiki Runner
     runner = STORMWikiRunner(engine_args, engine_lm_configs, rm)
 
-    # run the pipeline
-    topic = input("Topic: ")
-    runner.run(
-        topic=topic,
-        do_research=args.do_research,
-        do_generate_outline=args.do_generate_outline,
-        do_generate_article=args.do_generate_article,
-        do_polish_article=args.do_polish_article,
-    )
-    runner.post_run()
-    runner.summary()
+    # run the pipeline for each topic, reusing the loaded embedding model and vector store
+    for topic in topics:
+        runner.run(
+            topic=topic,
+            do_research=args.do_research,
+            do_generate_outline=args.do_generate_outline,
+            do_generate_article=args.do_generate_article,
+            do_polish_article=args.do_polish_article,
+        )
+        runner.post_run()
+        runner.summary()
+        runner.reset()
 
 
 if __name__ == "__main__":
@@ -162,6 +184,20 @@ if __name__ == "__main__":
         default="./results/gpt_retrieval",
         help="Directory to store the outputs.",
     )
+    parser.add_argument(
+        "--topic",
+        type=str,
+        action="append",
+        default=None,
+        help="Topic to write about. Can be repeated to run several topics in one process, reusing the loaded "
+        "models and clients. If neither --topic nor --topics-file is given, the topic is read from stdin.",
+    )
+    parser.add_argument(
+        "--topics-file",
+        type=str,
+        default=None,
+        help="Path to a text file with one topic per line to run in addition to --topic.",
+    )
     parser.add_argument(
         "--max-thread-num",
         type=int,
@@ -183,6 +219,14 @@ if __name__ == "__main__":
         default="BAAI/bge-m3",
         help="The collection name for vector store.",
     )
+    parser.add_argument(
+        "--embedding-backend",
+        type=str,
+        choices=["huggingface", "fastembed"],
+        default="huggingface",
+        help="Backend to run the embedding model. fastembed uses quantized ONNX models and is usually faster on "
+        "CPU, but only supports its own model list (e.g., BAAI/bge-small-en-v1.5).",
+    )
     parser.add_argument(
         "--device",
         type=str,
@@ -210,14 +254,41 @@ if __name__ == "__main__":
         "--csv-file-path",
         type=str,
         default=None,
-        help="The path of the custom document corpus in CSV format. The CSV file should include "
+        help="The path of the custom document corpus in CSV (or Parquet) format. The file should include "
         "content, title, url, and description columns.",
     )
     parser.add_argument(
         "--embed-batch-size",
         type=int,
-        default=64,
-        help="Batch size for embedding the documents in the csv file.",
+        default=256,
+        help="Number of document chunks embedded and written to the vector store per ingestion step. This is "
+        "not the encoder batch size: the embedding model still splits each step into its own batches.",
+    )
+    parser.add_argument(
+        "--embedding-cache-path",
+        type=str,
+        default="./.embed_cache.sqlite",
+        help="SQLite file caching document embeddings across runs so that unchanged documents are not "
+        "re-embedded when updating the vector store. Pass an empty string to disable the cache.",
+    )
+    parser.add_argument(
+        "--quantization",
+        type=str,
+        choices=["none", "scalar", "binary"],
+        default="none",
+        help="Vector quantization to use when creating a new collection (only effective in online mode).",
+    )
+    parser.add_argument(
+        "--on-disk-vectors",
+        action="store_true",
+        help="If True, keep the vectors of a new collection memory-mapped on disk instead of in RAM, trading "
+        "search latency for memory (only effective in online mode).",
+    )
+    parser.add_argument(
+        "--float16-vectors",
+        action="store_true",
+        help="If True, store the vectors of a new collection as float16 to halve their size (only effective "
+        "in online mode).",
     )
     # stage of the pipeline
     parser.add_argument(
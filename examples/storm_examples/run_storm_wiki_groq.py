@@ -41,6 +41,9 @@ from knowledge_storm.rm import (
 )
 from knowledge_storm.utils import load_api_key
 
+# Any character that isn't alphanumeric, underscore, or hyphen
+_INVALID_TOPIC_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 def sanitize_topic(topic):
     """
@@ -51,7 +54,7 @@ def sanitize_topic(topic):
     topic = topic.replace(" ", "_")
 
     # Remove any character that isn't alphanumeric, underscore, or hyphen
-    topic = re.sub(r"[^a-zA-Z0-9_-]", "", topic)
+    topic = _INVALID_TOPIC_CHARS_PATTERN.sub("", topic)
 
     # Ensure the topic isn't empty after sanitization
     if not topic:
@@ -175,16 +175,23 @@ def main(args):
         write_section_example
     ]
 
-    topic = input("Topic: ")
-    runner.run(
-        topic=topic,
-        do_research=args.do_research,
-        do_generate_outline=args.do_generate_outline,
-        do_generate_article=args.do_generate_article,
-        do_polish_article=args.do_polish_article,
-    )
-    runner.post_run()
-    runner.summary()
+    topics = list(args.topic or [])
+    if args.topics_file:
+        with open(args.topics_file) as f:
+            topics.extend(line.strip() for line in f if line.strip())
+    if not topics:
+        topics = [input("Topic: ")]
+    for topic in topics:
+        runner.run(
+            topic=topic,
+            do_research=args.do_research,
+            do_generate_outline=args.do_generate_outline,
+            do_generate_article=args.do_generate_article,
+            do_polish_article=args.do_polish_article,
+        )
+        runner.post_run()
+        runner.summary()
+        runner.reset()
 
 
 if __name__ == "__main__":
@@ -202,13 +209,28 @@ if __name__ == "__main__":
         default="./results/mistral_7b",
         help="Directory to store the outputs.",
     )
+    parser.add_argument(
+        "--topic",
+        type=str,
+        action="append",
+        default=None,
+        help="Topic to write about. Can be repeated to run several topics in one process, reusing the loaded "
+        "models and clients. If neither --topic nor --topics-file is given, the topic is read from stdin.",
+    )
+    parser.add_argument(
+        "--topics-file",
+        type=str,
+        default=None,
+        help="Path to a text file with one topic per line to run in addition to --topic.",
+    )
     parser.add_argument(
         "--max-thread-num",
         type=int,
-        default=3,
+        default=8,
         help="Maximum number of threads to use. The information seeking part and the article generation"
-        "part can speed up by using multiple threads. Consider reducing it if keep getting "
-        '"Exceed rate limit" error when calling LM API.',
+        "part can speed up by using multiple threads. The self-hosted vLLM server batches concurrent requests, "
+        "so the default is higher than for hosted LM APIs. Consider reducing it if keep getting "
+        '"Exceed rate limit" error when calling the search API.',
     )
     parser.add_argument(
         "--retriever",
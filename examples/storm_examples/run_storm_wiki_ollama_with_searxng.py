@@ -24,8 +24,9 @@ def main(args):
         "stop": ("\n\n---",),
     }
 
+    # Conversation simulation and question asking use identical settings, so they share one client.
     conv_simulator_lm = OllamaClient(max_tokens=500, **ollama_kwargs)
-    question_asker_lm = OllamaClient(max_tokens=500, **ollama_kwargs)
+    question_asker_lm = conv_simulator_lm
     outline_gen_lm = OllamaClient(max_tokens=400, **ollama_kwargs)
     article_gen_lm = OllamaClient(max_tokens=700, **ollama_kwargs)
     article_polish_lm = OllamaClient(max_tokens=4000, **ollama_kwargs)
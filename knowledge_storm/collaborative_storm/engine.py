@@ -1,5 +1,6 @@
 import dspy
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from typing import List, Union, Literal, Optional, Dict
 
@@ -16,7 +17,7 @@ from .modules.warmstart_hierarchical_chat import WarmStartModule
 from ..dataclass import ConversationTurn, KnowledgeBase
 from ..encoder import Encoder
 from ..interface import LMConfigs, Agent
-from ..logging_wrapper import LoggingWrapper
+from ..logging_wrapper import EventLog, LoggingWrapper
 from ..lm import LitellmModel
 from ..rm import BingSearch
 
@@ -728,29 +729,40 @@ class CoStormRunner:
                         conversation_history=self.conversation_history,
                     )
 
-                if turn_policy.should_update_experts_list:
-                    with self.logging_wrapper.log_event(
-                        f"{cur_turn_name}: update experts list"
-                    ):
-                        self.discourse_manager._update_expert_list_from_utterance(
-                            focus=last_conv_turn.raw_utterance,
-                            background_info=conv_turn.raw_utterance,
-                        )
-
-                if conv_turn is not None:
-                    self.conversation_history.append(conv_turn)
-                    with self.logging_wrapper.log_event(
-                        f"{cur_turn_name}: insert into knowledge base"
-                    ):
-                        if self.callback_handler is not None:
-                            self.callback_handler.on_mindmap_insert_start()
-                        self.knowledge_base.update_from_conv_turn(
-                            conv_turn=conv_turn,
-                            allow_create_new_node=True,
-                            insert_under_root=self.runner_argument.rag_only_baseline_mode,
-                        )
-                        if self.callback_handler is not None:
-                            self.callback_handler.on_mindmap_insert_end()
+                def update_experts_list():
+                    # Timed here rather than with `log_event`, whose event stack is not thread-safe.
+                    event = EventLog(event_name=f"{cur_turn_name}: update experts list")
+                    event.record_start_time()
+                    self.discourse_manager._update_expert_list_from_utterance(
+                        focus=last_conv_turn.raw_utterance,
+                        background_info=conv_turn.raw_utterance,
+                    )
+                    event.record_end_time()
+                    return event
+
+                # Expert list update and knowledge base insertion use different LMs and do not depend on each
+                # other, so the expert generation call runs in the background while the new turn is inserted.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    update_experts_future = None
+                    if turn_policy.should_update_experts_list:
+                        update_experts_future = executor.submit(update_experts_list)
+
+                    if conv_turn is not None:
+                        self.conversation_history.append(conv_turn)
+                        with self.logging_wrapper.log_event(
+                            f"{cur_turn_name}: insert into knowledge base"
+                        ):
+                            if self.callback_handler is not None:
+                                self.callback_handler.on_mindmap_insert_start()
+                            self.knowledge_base.update_from_conv_turn(
+                                conv_turn=conv_turn,
+                                allow_create_new_node=True,
+                                insert_under_root=self.runner_argument.rag_only_baseline_mode,
+                            )
+                            if self.callback_handler is not None:
+                                self.callback_handler.on_mindmap_insert_end()
+                    if update_experts_future is not None:
+                        self.logging_wrapper.add_event(update_experts_future.result())
                 if turn_policy.should_reorganize_knowledge_base:
                     with self.logging_wrapper.log_event(
                         f"{cur_turn_name}: reorganize knowledge base"
@@ -75,6 +75,8 @@ class AnswerQuestionModule(dspy.Module):
                 q.replace("-", "").strip().strip('"').strip('"').strip()
                 for q in queries.split("\n")
             ]
+            # drop empty and duplicate queries so that no search call is wasted on them
+            queries = list(dict.fromkeys(q for q in queries if q))
             queries = queries[: self.max_search_queries]
         self.logging_wrapper.add_query_count(count=len(queries))
         with self.logging_wrapper.log_event(
@@ -82,7 +84,7 @@ class AnswerQuestionModule(dspy.Module):
         ):
             # retrieve information using retriever
             searched_results: List[Information] = self.retriever.retrieve(
-                list(set(queries)), exclude_urls=[]
+                queries, exclude_urls=[]
             )
         # update storm information meta to include the question
         for storm_info in searched_results:
@@ -185,7 +185,7 @@ class KnowledgeNode:
         Returns:
             str: String representation of the KnowledgeNode instance.
         """
-        return f"KnowledgeNode(name={self.name}, content={self.content}, children={len(self.children)})"
+        return f"KnowledgeNode(name={self.name}, n_content={len(self.content)}, children={len(self.children)})"
 
     def get_path_from_root(self, root: Optional["KnowledgeNode"] = None):
         """
@@ -1,8 +1,9 @@
+import logging
 import os
 import numpy as np
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple, Union, Optional, Dict, Literal
+from typing import List, Union, Optional, Dict, Literal
 from pathlib import Path
 
 try:
@@ -73,6 +74,8 @@ class Encoder:
         self.embedding_model_name = None
         self.kargs = {}
         self.total_token_usage = 0
+        # In-memory embedding cache keyed by text, shared by all callers of this encoder.
+        self._embedding_cache: Dict[str, List[float]] = {}
 
         # Initialize the appropriate embedding model
         encoder_type = encoder_type or os.getenv("ENCODER_API_TYPE")
@@ -109,17 +112,26 @@ class Encoder:
             self.total_token_usage = 0
         return token_usage
 
-    def encode(self, texts: Union[str, List[str]], max_workers: int = 5) -> np.ndarray:
+    def encode(
+        self,
+        texts: Union[str, List[str]],
+        max_workers: int = 5,
+        batch_size: int = 64,
+    ) -> np.ndarray:
         """
         Public method to get embeddings for the given texts.
 
         Args:
             texts (Union[str, List[str]]): A single text string or a list of text strings to embed.
+            max_workers (int): The maximum number of workers for parallel processing.
+            batch_size (int): The number of texts sent in a single embedding request.
 
         Returns:
             np.ndarray: The array of embeddings.
         """
-        return self._get_text_embeddings(texts, max_workers=max_workers)
+        return self._get_text_embeddings(
+            texts, max_workers=max_workers, batch_size=batch_size
+        )
 
     def _get_single_text_embedding(self, text):
         response = litellm.embedding(
@@ -129,50 +141,80 @@ class Encoder:
         token_usage = response.get("usage", {}).get("total_tokens", 0)
         return text, embedding, token_usage
 
+    def _get_batch_text_embeddings(self, texts: List[str]):
+        response = litellm.embedding(
+            model=self.embedding_model_name, input=texts, caching=True, **self.kargs
+        )
+        # The embedding API may return the results out of order.
+        data = sorted(response.data, key=lambda x: x["index"])
+        embeddings = [item["embedding"] for item in data]
+        token_usage = response.get("usage", {}).get("total_tokens", 0)
+        return embeddings, token_usage
+
     def _get_text_embeddings(
         self,
         texts: Union[str, List[str]],
         max_workers: int = 5,
-    ) -> Tuple[np.ndarray, int]:
+        batch_size: int = 64,
+    ) -> np.ndarray:
         """
-        Get text embeddings using OpenAI's text-embedding-3-small model.
+        Get text embeddings using the configured embedding model.
+
+        Previously embedded texts are served from the in-memory cache. The remaining texts are sent in batches of
+        `batch_size` per request and the batches are processed in parallel. A batch whose request fails is retried
+        one text at a time.
 
         Args:
             texts (Union[str, List[str]]): A single text string or a list of text strings to embed.
             max_workers (int): The maximum number of workers for parallel processing.
-            api_key (str): The API key for accessing OpenAI's services.
-            embedding_cache (Optional[Dict[str, np.ndarray]]): A cache to store previously computed embeddings.
+            batch_size (int): The number of texts sent in a single embedding request.
 
         Returns:
-            Tuple[np.ndarray, int]: The 2D array of embeddings and the total token usage.
+            np.ndarray: The array of embeddings (1D for a single text, 2D for a list of texts).
         """
 
         if isinstance(texts, str):
-            _, embedding, tokens = self._get_single_text_embedding(texts)
-            self.total_token_usage += tokens
-            return np.array(embedding)
-
-        embeddings = []
+            if texts not in self._embedding_cache:
+                _, embedding, tokens = self._get_single_text_embedding(texts)
+                self._embedding_cache[texts] = embedding
+                self.total_token_usage += tokens
+            return np.array(self._embedding_cache[texts])
+
+        # Only texts that have not been embedded before are sent to the embedding API.
+        texts_to_embed = list(
+            dict.fromkeys(text for text in texts if text not in self._embedding_cache)
+        )
+        batches = [
+            texts_to_embed[i : i + batch_size]
+            for i in range(0, len(texts_to_embed), batch_size)
+        ]
         total_tokens = 0
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(self._get_single_text_embedding, text): text
-                for text in texts
+                executor.submit(self._get_batch_text_embeddings, batch): batch
+                for batch in batches
             }
 
             for future in as_completed(futures):
+                batch = futures[future]
                 try:
-                    text, embedding, tokens = future.result()
-                    embeddings.append((text, embedding, tokens))
+                    embeddings, tokens = future.result()
+                    self._embedding_cache.update(zip(batch, embeddings))
                     total_tokens += tokens
                 except Exception as e:
-                    print(f"An error occurred for text: {futures[future]}")
-                    print(e)
-
-        # Sort results to match the order of the input texts
-        embeddings.sort(key=lambda x: texts.index(x[0]))
-        embeddings = [result[1] for result in embeddings]
+                    logging.warning(
+                        f"Embedding request for a batch of {len(batch)} texts failed, "
+                        f"retrying one text at a time: {e}"
+                    )
+                    # Errors here propagate so the result never silently drops texts.
+                    for text in batch:
+                        _, embedding, tokens = self._get_single_text_embedding(text)
+                        self._embedding_cache[text] = embedding
+                        total_tokens += tokens
+
+        # Look up the cache so the results match the order of the input texts.
+        embeddings = [self._embedding_cache[text] for text in texts]
         self.total_token_usage += total_tokens
 
         return np.array(embeddings)
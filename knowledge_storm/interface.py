@@ -269,6 +269,9 @@ class Retriever:
     def __init__(self, rm: dspy.Retrieve, max_thread: int = 1):
         self.max_thread = max_thread
         self.rm = rm
+        # Search results keyed by the normalized query and the excluded urls. Different perspectives and
+        # conversation turns often issue the same query, so repeated queries are served without calling the rm.
+        self._search_cache = {}
 
     def collect_and_reset_rm_usage(self):
         combined_usage = []
@@ -292,18 +295,30 @@ class Retriever:
         to_return = []
 
         def process_query(q):
-            retrieved_data_list = self.rm(
-                query_or_queries=[q], exclude_urls=exclude_urls
-            )
+            cache_key = (" ".join(q.lower().split()), tuple(exclude_urls))
+            retrieved_data_list = self._search_cache.get(cache_key)
+            if retrieved_data_list is None:
+                retrieved_data_list = self.rm(
+                    query_or_queries=[q], exclude_urls=exclude_urls
+                )
+                for data in retrieved_data_list:
+                    for i in range(len(data["snippets"])):
+                        # STORM generate the article with citations. We do not consider multi-hop citations.
+                        # Remove citations in the source to avoid confusion.
+                        data["snippets"][i] = ArticleTextProcessing.remove_citations(
+                            data["snippets"][i]
+                        )
+                self._search_cache[cache_key] = retrieved_data_list
             local_to_return = []
             for data in retrieved_data_list:
-                for i in range(len(data["snippets"])):
-                    # STORM generate the article with citations. We do not consider multi-hop citations.
-                    # Remove citations in the source to avoid confusion.
-                    data["snippets"][i] = ArticleTextProcessing.remove_citations(
-                        data["snippets"][i]
-                    )
-                storm_info = Information.from_dict(data)
+                # Copy the mutable fields so that cached results are not modified by later processing.
+                storm_info = Information.from_dict(
+                    {
+                        **data,
+                        "snippets": list(data["snippets"]),
+                        "meta": dict(data.get("meta") or {}),
+                    }
+                )
                 storm_info.meta["query"] = q
                 local_to_return.append(storm_info)
             return local_to_return
@@ -12,6 +12,7 @@ from pathlib import Path
 
 
 from dsp import ERRORS, backoff_hdlr, giveup_hdlr
+from dsp.modules.cache_utils import CacheMemory
 from dsp.modules.hf import openai_to_hf
 from dsp.modules.hf_client import send_hftgi_request_v01_wrapped
 from openai import OpenAI, AzureOpenAI
@@ -62,11 +63,13 @@ class LM:
         temperature=0.0,
         max_tokens=1000,
         cache=True,
+        num_retries=8,
         **kwargs,
     ):
         self.model = model
         self.model_type = model_type
         self.cache = cache
+        self.num_retries = num_retries
         self.kwargs = dict(temperature=temperature, max_tokens=max_tokens, **kwargs)
         self.history = []
 
@@ -89,8 +92,10 @@ class LM:
                 cached_litellm_text_completion if cache else litellm_text_completion
             )
 
+        # The retry count is passed outside of the request, and LiteLLM leaves it out of its disk cache key.
         response = completion(
-            ujson.dumps(dict(model=self.model, messages=messages, **kwargs))
+            ujson.dumps(dict(model=self.model, messages=messages, **kwargs)),
+            num_retries=self.num_retries,
         )
         outputs = [
             c.message.content if hasattr(c, "message") else c["text"]
@@ -113,23 +118,40 @@ class LM:
 
 
 @functools.lru_cache(maxsize=LM_LRU_CACHE_MAX_SIZE)
-def cached_litellm_completion(request):
-    return litellm_completion(request, cache={"no-cache": False, "no-store": False})
+def cached_litellm_completion(request, num_retries=0):
+    return litellm_completion(
+        request,
+        num_retries=num_retries,
+        cache={"no-cache": False, "no-store": False},
+    )
 
 
-def litellm_completion(request, cache={"no-cache": True, "no-store": True}):
+def litellm_completion(
+    request, num_retries=0, cache={"no-cache": True, "no-store": True}
+):
     kwargs = ujson.loads(request)
-    return litellm.completion(cache=cache, **kwargs)
+    # LiteLLM retries failed requests (e.g., rate limit errors) num_retries times. Without an explicit strategy it
+    # retries immediately, without waiting between attempts.
+    return litellm.completion(
+        cache=cache,
+        num_retries=num_retries,
+        retry_strategy="exponential_backoff_retry",
+        **kwargs,
+    )
 
 
 @functools.lru_cache(maxsize=LM_LRU_CACHE_MAX_SIZE)
-def cached_litellm_text_completion(request):
+def cached_litellm_text_completion(request, num_retries=0):
     return litellm_text_completion(
-        request, cache={"no-cache": False, "no-store": False}
+        request,
+        num_retries=num_retries,
+        cache={"no-cache": False, "no-store": False},
     )
 
 
-def litellm_text_completion(request, cache={"no-cache": True, "no-store": True}):
+def litellm_text_completion(
+    request, num_retries=0, cache={"no-cache": True, "no-store": True}
+):
     kwargs = ujson.loads(request)
 
     # Extract the provider and model from the model string.
@@ -151,6 +173,8 @@ def litellm_text_completion(request, cache={"no-cache": True, "no-store": True})
         api_key=api_key,
         api_base=api_base,
         prompt=prompt,
+        num_retries=num_retries,
+        retry_strategy="exponential_backoff_retry",
         **kwargs,
     )
 
@@ -244,8 +268,10 @@ class LitellmModel(LM):
                 cached_litellm_text_completion if cache else litellm_text_completion
             )
 
+        # The retry count is passed outside of the request, and LiteLLM leaves it out of its disk cache key.
         response = completion(
-            ujson.dumps(dict(model=self.model, messages=messages, **kwargs))
+            ujson.dumps(dict(model=self.model, messages=messages, **kwargs)),
+            num_retries=self.num_retries,
         )
         response_dict = response.json()
         self.log_usage(response_dict)
@@ -363,6 +389,26 @@ class OpenAIModel(dspy.OpenAI):
         return completions
 
 
+# Shared by the models that call OpenAI-compatible HTTP endpoints directly (DeepSeek, Groq) so that the
+# different roles of a pipeline reuse keep-alive connections instead of opening a new one per request.
+_http_session = requests.Session()
+
+
+@CacheMemory.cache(ignore=["api_key"])
+def _cached_chat_completion_request(url: str, api_key: str, data: dict):
+    """Send a chat completion request, caching successful responses on disk like dspy.OpenAI does.
+
+    The API key is excluded from the cache key so it is never written to the cache directory.
+    """
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
+    response = _http_session.post(url, headers=headers, json=data)
+    response.raise_for_status()
+    return response.json()
+
+
 class DeepSeekModel(dspy.OpenAI):
     """A wrapper class for DeepSeek API, compatible with dspy.OpenAI."""
 
@@ -414,20 +460,14 @@ class DeepSeekModel(dspy.OpenAI):
     )
     def _create_completion(self, prompt: str, **kwargs):
         """Create a completion using the DeepSeek API."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
         data = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             **kwargs,
         }
-        response = requests.post(
-            f"{self.api_base}/v1/chat/completions", headers=headers, json=data
+        return _cached_chat_completion_request(
+            f"{self.api_base}/v1/chat/completions", self.api_key, data
         )
-        response.raise_for_status()
-        return response.json()
 
     def __call__(
         self,
@@ -458,6 +498,31 @@ class DeepSeekModel(dspy.OpenAI):
         return completions
 
 
+@functools.lru_cache(maxsize=None)
+def _get_azure_openai_client(azure_endpoint: str, api_key: str, api_version: str):
+    """Share one AzureOpenAI client (and its connection pool) across models using the same deployment."""
+    return AzureOpenAI(
+        azure_endpoint=azure_endpoint,
+        api_key=api_key,
+        api_version=api_version,
+    )
+
+
+@CacheMemory.cache(ignore=["client"])
+def _cached_azure_openai_request(
+    client: AzureOpenAI, azure_endpoint: str, model_type: str, prompt: str, kwargs: dict
+):
+    """Send a request to an Azure OpenAI deployment, caching successful responses on disk like dspy.OpenAI does.
+
+    The client (which holds the API key) is excluded from the cache key; the endpoint identifies the deployment.
+    """
+    if model_type == "chat":
+        return client.chat.completions.create(
+            messages=[{"role": "user", "content": prompt}], **kwargs
+        )
+    return client.completions.create(prompt=prompt, **kwargs)
+
+
 class AzureOpenAIModel(dspy.LM):
     """A wrapper class of Azure OpenAI endpoint.
 
@@ -480,8 +545,9 @@ class AzureOpenAIModel(dspy.LM):
         self.model = model
         self.provider = "azure"
         self.model_type = model_type
+        self.azure_endpoint = azure_endpoint
 
-        self.client = AzureOpenAI(
+        self.client = _get_azure_openai_client(
             azure_endpoint=azure_endpoint,
             api_key=api_key,
             api_version=api_version,
@@ -511,14 +577,9 @@ class AzureOpenAIModel(dspy.LM):
         kwargs = {**self.kwargs, **kwargs}
 
         try:
-            if self.model_type == "chat":
-                messages = [{"role": "user", "content": prompt}]
-
-                response = self.client.chat.completions.create(
-                    messages=messages, **kwargs
-                )
-            else:
-                response = self.client.completions.create(prompt=prompt, **kwargs)
+            response = _cached_azure_openai_request(
+                self.client, self.azure_endpoint, self.model_type, prompt, kwargs
+            )
 
             self.log_usage(response)
 
@@ -643,11 +704,6 @@ class GroqModel(dspy.OpenAI):
     )
     def _create_completion(self, prompt: str, **kwargs):
         """Create a completion using the Groq API."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
         # Remove unsupported fields
         kwargs.pop("logprobs", None)
         kwargs.pop("logit_bias", None)
@@ -671,11 +727,9 @@ class GroqModel(dspy.OpenAI):
         for message in data["messages"]:
             message.pop("name", None)
 
-        response = requests.post(
-            f"{self.api_base}/chat/completions", headers=headers, json=data
+        return _cached_chat_completion_request(
+            f"{self.api_base}/chat/completions", self.api_key, data
         )
-        response.raise_for_status()
-        return response.json()
 
     def __call__(
         self,
@@ -706,6 +760,17 @@ class GroqModel(dspy.OpenAI):
         return completions
 
 
+@functools.lru_cache(maxsize=None)
+def _get_anthropic_client(api_key: Optional[str]):
+    """Share one Anthropic client (and its connection pool) across models using the same API key."""
+    try:
+        from anthropic import Anthropic
+    except ImportError as err:
+        raise ImportError("Claude requires `pip install anthropic`.") from err
+
+    return Anthropic(api_key=api_key)
+
+
 class ClaudeModel(dspy.dsp.modules.lm.LM):
     """Copied from dspy/dsp/modules/anthropic.py with the addition of tracking token usage."""
 
@@ -717,11 +782,6 @@ class ClaudeModel(dspy.dsp.modules.lm.LM):
         **kwargs,
     ):
         super().__init__(model)
-        try:
-            from anthropic import Anthropic
-        except ImportError as err:
-            raise ImportError("Claude requires `pip install anthropic`.") from err
-
         self.provider = "anthropic"
         self.api_key = api_key = (
             os.environ.get("ANTHROPIC_API_KEY") if api_key is None else api_key
@@ -739,7 +799,7 @@ class ClaudeModel(dspy.dsp.modules.lm.LM):
             "model": model,
         }
         self.history: list[dict[str, Any]] = []
-        self.client = Anthropic(api_key=api_key)
+        self.client = _get_anthropic_client(api_key)
         self.model = model
 
         self._token_usage_lock = threading.Lock()
@@ -842,6 +902,12 @@ class ClaudeModel(dspy.dsp.modules.lm.LM):
         return completions
 
 
+@functools.lru_cache(maxsize=None)
+def _get_openai_client(base_url: str, api_key: str):
+    """Share one OpenAI client (and its connection pool) across models served by the same endpoint."""
+    return OpenAI(base_url=base_url, api_key=api_key)
+
+
 class VLLMClient(dspy.dsp.LM):
     """A client compatible with vLLM HTTP server.
 
@@ -865,7 +931,7 @@ class VLLMClient(dspy.dsp.LM):
         self.base_url = f"{url}:{port}/v1/"
         if model_type == "chat":
             self.base_url += "chat/"
-        self.client = OpenAI(base_url=self.base_url, api_key=api_key)
+        self.client = _get_openai_client(self.base_url, api_key)
         self.prompt_tokens = 0
         self.completion_tokens = 0
         self._token_usage_lock = threading.Lock()
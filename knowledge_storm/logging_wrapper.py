@@ -160,6 +160,17 @@ class LoggingWrapper:
 
         self.logging_dict[self.current_pipeline_stage]["query_count"] += count
 
+    def add_event(self, event: EventLog):
+        """Record an event that was timed outside `log_event`, e.g., in a worker thread."""
+        if not self.pipeline_stage_active:
+            raise RuntimeError("No pipeline stage is currently active.")
+
+        if self.event_stack:
+            self.event_stack[-1].add_child_event(event)
+        self.logging_dict[self.current_pipeline_stage]["time_usage"][
+            event.event_name
+        ] = event
+
     @contextmanager
     def log_event(self, event_name):
         if not self.pipeline_stage_active:
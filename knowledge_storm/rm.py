@@ -7,7 +7,7 @@ import dspy
 import requests
 from dsp import backoff_hdlr, giveup_hdlr
 
-from .utils import WebPageHelper
+from .utils import WebPageHelper, load_embedding_model
 
 
 class YouRM(dspy.Retrieve):
@@ -22,6 +22,7 @@ class YouRM(dspy.Retrieve):
         else:
             self.ydc_api_key = os.environ["YDC_API_KEY"]
         self.usage = 0
+        self.session = requests.Session()
 
         # If not None, is_valid_source shall be a function that takes a URL and returns a boolean.
         if is_valid_source:
@@ -57,7 +58,7 @@ class YouRM(dspy.Retrieve):
         for query in queries:
             try:
                 headers = {"X-API-Key": self.ydc_api_key}
-                results = requests.get(
+                results = self.session.get(
                     f"https://api.ydc-index.io/search?query={query}",
                     headers=headers,
                 ).json()
@@ -112,6 +113,7 @@ class BingSearch(dspy.Retrieve):
             max_thread_num=webpage_helper_max_threads,
         )
         self.usage = 0
+        self.session = requests.Session()
 
         # If not None, is_valid_source shall be a function that takes a URL and returns a boolean.
         if is_valid_source:
@@ -150,7 +152,7 @@ class BingSearch(dspy.Retrieve):
 
         for query in queries:
             try:
-                results = requests.get(
+                results = self.session.get(
                     self.endpoint, headers=headers, params={**self.params, "q": query}
                 ).json()
 
@@ -194,15 +196,16 @@ class VectorRM(dspy.Retrieve):
         embedding_model: str,
         device: str = "mps",
         k: int = 3,
+        embedding_backend: str = "huggingface",
     ):
-        from langchain_huggingface import HuggingFaceEmbeddings
-
         """
         Params:
             collection_name: Name of the Qdrant collection.
             embedding_model: Name of the Hugging Face embedding model.
             device: Device to run the embeddings model on, can be "mps", "cuda", "cpu".
             k: Number of top chunks to retrieve.
+            embedding_backend: "huggingface" (sentence-transformers) or "fastembed" (ONNX). Must match the backend
+                used to build the collection.
         """
         super().__init__(k=k)
         self.usage = 0
@@ -213,13 +216,7 @@ class VectorRM(dspy.Retrieve):
         if not embedding_model:
             raise ValueError("Please provide an embedding model.")
 
-        model_kwargs = {"device": device}
-        encode_kwargs = {"normalize_embeddings": True}
-        self.model = HuggingFaceEmbeddings(
-            model_name=embedding_model,
-            model_kwargs=model_kwargs,
-            encode_kwargs=encode_kwargs,
-        )
+        self.model = load_embedding_model(embedding_model, device, embedding_backend)
 
         self.collection_name = collection_name
         self.client = None
@@ -288,6 +285,19 @@ class VectorRM(dspy.Retrieve):
         except Exception as e:
             raise ValueError(f"Error occurs when loading the vector store: {e}")
 
+    def warm_up(self):
+        """
+        Run one throwaway query so that the first real query does not pay for loading the embedding model's
+        kernels and the Qdrant index pages. It is not counted in the usage.
+        """
+        if self.client is None:
+            raise ValueError("Qdrant client is not initialized.")
+        self.client.query_points(
+            collection_name=self.collection_name,
+            query=self.model.embed_query(self.collection_name),
+            limit=1,
+        )
+
     def get_usage_and_reset(self):
         usage = self.usage
         self.usage = 0
@@ -344,6 +354,7 @@ class StanfordOvalArxivRM(dspy.Retrieve):
         super().__init__(k=k)
         self.endpoint = endpoint
         self.usage = 0
+        self.session = requests.Session()
         self.rerank = rerank
 
     def get_usage_and_reset(self):
@@ -355,7 +366,7 @@ class StanfordOvalArxivRM(dspy.Retrieve):
     def _retrieve(self, query: str):
         payload = {"query": query, "num_blocks": self.k, "rerank": self.rerank}
 
-        response = requests.post(
+        response = self.session.post(
             self.endpoint, json=payload, headers={"Content-Type": "application/json"}
         )
 
@@ -436,6 +447,7 @@ class SerperRM(dspy.Retrieve):
         """
         super().__init__(k=k)
         self.usage = 0
+        self.session = requests.Session()
         self.query_params = None
         self.ENABLE_EXTRA_SNIPPET_EXTRACTION = ENABLE_EXTRA_SNIPPET_EXTRACTION
         self.webpage_helper = WebPageHelper(
@@ -471,7 +483,7 @@ class SerperRM(dspy.Retrieve):
             "Content-Type": "application/json",
         }
 
-        response = requests.request(
+        response = self.session.request(
             "POST", self.search_url, headers=headers, json=query_params
         )
 
@@ -581,6 +593,7 @@ class BraveRM(dspy.Retrieve):
         else:
             self.brave_search_api_key = os.environ["BRAVE_API_KEY"]
         self.usage = 0
+        self.session = requests.Session()
 
         # If not None, is_valid_source shall be a function that takes a URL and returns a boolean.
         if is_valid_source:
@@ -620,7 +633,7 @@ class BraveRM(dspy.Retrieve):
                     "Accept-Encoding": "gzip",
                     "X-Subscription-Token": self.brave_search_api_key,
                 }
-                response = requests.get(
+                response = self.session.get(
                     f"https://api.search.brave.com/res/v1/web/search?result_filter=web&q={query}",
                     headers=headers,
                 ).json()
@@ -665,6 +678,7 @@ class SearXNG(dspy.Retrieve):
         self.searxng_api_url = searxng_api_url
         self.searxng_api_key = searxng_api_key
         self.usage = 0
+        self.session = requests.Session()
 
         if is_valid_source:
             self.is_valid_source = is_valid_source
@@ -704,7 +718,7 @@ class SearXNG(dspy.Retrieve):
         for query in queries:
             try:
                 params = {"q": query, "format": "json"}
-                response = requests.get(
+                response = self.session.get(
                     self.searxng_api_url, headers=headers, params=params
                 )
                 results = response.json()
@@ -1,16 +1,22 @@
 import copy
+import functools
 import re
 from collections import OrderedDict
 from typing import Union, Optional, Any, List, Tuple, Dict
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ...interface import Information, InformationTable, Article, ArticleSectionNode
 from ...utils import ArticleTextProcessing, FileIOHelper
 
 
+@functools.lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str) -> SentenceTransformer:
+    """Load the sentence encoder once per process and share it across information tables."""
+    return SentenceTransformer(model_name)
+
+
 class DialogueTurn:
     def __init__(
         self,
@@ -91,9 +97,7 @@ class StormInformationTable(InformationTable):
         return conversation_log
 
     def dump_url_to_info(self, path):
-        url_to_info = copy.deepcopy(self.url_to_info)
-        for url in url_to_info:
-            url_to_info[url] = url_to_info[url].to_dict()
+        url_to_info = {url: info.to_dict() for url, info in self.url_to_info.items()}
         FileIOHelper.dump_json(url_to_info, path)
 
     @classmethod
@@ -107,14 +111,17 @@ class StormInformationTable(InformationTable):
         return cls(conversations)
 
     def prepare_table_for_retrieval(self):
-        self.encoder = SentenceTransformer("paraphrase-MiniLM-L6-v2")
+        self.encoder = _load_sentence_transformer("paraphrase-MiniLM-L6-v2")
         self.collected_urls = []
         self.collected_snippets = []
         for url, information in self.url_to_info.items():
             for snippet in information.snippets:
                 self.collected_urls.append(url)
                 self.collected_snippets.append(snippet)
-        self.encoded_snippets = self.encoder.encode(self.collected_snippets)
+        # Normalize once here so that retrieval only needs a dot product for cosine similarity.
+        self.encoded_snippets = self.encoder.encode(
+            self.collected_snippets, normalize_embeddings=True
+        )
 
     def retrieve_information(
         self, queries: Union[List[str], str], search_top_k
@@ -123,9 +130,10 @@ class StormInformationTable(InformationTable):
         selected_snippets = []
         if type(queries) is str:
             queries = [queries]
-        for query in queries:
-            encoded_query = self.encoder.encode(query)
-            sim = cosine_similarity([encoded_query], self.encoded_snippets)[0]
+        # Encode all queries in a single batched forward pass.
+        encoded_queries = self.encoder.encode(queries, normalize_embeddings=True)
+        sims = encoded_queries @ self.encoded_snippets.T
+        for sim in sims:
             sorted_indices = np.argsort(sim)
             for i in sorted_indices[-search_top_k:][::-1]:
                 selected_urls.append(self.collected_urls[i])
@@ -139,7 +147,8 @@ class StormInformationTable(InformationTable):
 
         selected_url_to_info = {}
         for url in url_to_snippets:
-            selected_url_to_info[url] = copy.deepcopy(self.url_to_info[url])
+            # Shallow copy is enough as only the snippets list is replaced.
+            selected_url_to_info[url] = copy.copy(self.url_to_info[url])
             selected_url_to_info[url].snippets = list(url_to_snippets[url])
 
         return list(selected_url_to_info.values())
@@ -163,12 +172,13 @@ class StormArticle(Article):
         Return:
             reference of the node or None if section name has no match
         """
-        if node.section_name == name:
-            return node
-        for child in node.children:
-            result = self.find_section(child, name)
-            if result:
-                return result
+        # Iterative pre-order traversal so deep outlines do not hit the recursion limit.
+        stack = [node]
+        while stack:
+            current_node = stack.pop()
+            if current_node.section_name == name:
+                return current_node
+            stack.extend(reversed(current_node.children))
         return None
 
     def _merge_new_info_to_references(
@@ -478,9 +488,10 @@ class StormArticle(Article):
         FileIOHelper.write_str("\n".join(outline), file_path)
 
     def dump_reference_to_file(self, file_path):
-        reference = copy.deepcopy(self.reference)
-        for url in reference["url_to_info"]:
-            reference["url_to_info"][url] = reference["url_to_info"][url].to_dict()
+        reference = dict(self.reference)
+        reference["url_to_info"] = {
+            url: info.to_dict() for url, info in self.reference["url_to_info"].items()
+        }
         FileIOHelper.dump_json(reference, file_path)
 
     def dump_article_as_plain_text(self, file_path):
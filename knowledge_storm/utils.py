@@ -1,5 +1,8 @@
+import array
 import concurrent.futures
 import dspy
+import functools
+import hashlib
 import httpx
 import json
 import logging
@@ -7,8 +10,10 @@ import os
 import pickle
 import re
 import regex
+import sqlite3
 import sys
 import toml
+import uuid
 from typing import List, Dict
 from tqdm import tqdm
 
@@ -17,8 +22,37 @@ from trafilatura import extract
 
 from .lm import LitellmModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.getLogger("httpx").setLevel(logging.WARNING)  # Disable INFO logging for httpx.
 
+# Regex pattern to match sentence endings, including optional citation markers.
+_EOS_PATTERN = re.compile(r"([.!?])\s*(\[\d+\])?\s*")
+_CITATION_PATTERN = re.compile(r"\[(\d+)\]")
+_BRACKET_PATTERN = re.compile(r"\[.*?\]")
+# Sections that should not appear in a generated outline. The patterns are applied in order since
+# removing one section can expose another (e.g., "### Notes" leaves a "#" in front of the next header).
+_OUTLINE_REFERENCE_SECTION_PATTERNS = tuple(
+    re.compile(pattern, flags=re.DOTALL)
+    for pattern in (
+        r"#[#]? See also.*?(?=##|$)",
+        r"#[#]? See Also.*?(?=##|$)",
+        r"#[#]? Notes.*?(?=##|$)",
+        r"#[#]? References.*?(?=##|$)",
+        r"#[#]? External links.*?(?=##|$)",
+        r"#[#]? External Links.*?(?=##|$)",
+        r"#[#]? Bibliography.*?(?=##|$)",
+        r"#[#]? Further reading*?(?=##|$)",
+        r"#[#]? Further Reading*?(?=##|$)",
+        r"#[#]? Summary.*?(?=##|$)",
+        r"#[#]? Appendices.*?(?=##|$)",
+        r"#[#]? Appendix.*?(?=##|$)",
+    )
+)
+
 
 def truncate_filename(filename, max_length=125):
     """Truncate filename to max_length to ensure the filename won't exceed the file system limit.
@@ -57,6 +91,142 @@ def makeStringRed(message):
     return f"\033[91m {message}\033[00m"
 
 
+@functools.lru_cache(maxsize=None)
+def load_embedding_model(
+    embedding_model: str, device: str = "mps", backend: str = "huggingface"
+):
+    """
+    Load a LangChain embedding model once per process so that the vector store manager and `VectorRM` share it.
+
+    Args:
+        embedding_model: Name of the embedding model.
+        device: Device to run the model on, can be "mps", "cuda", "cpu". Only used by the "huggingface" backend,
+            which loads the model in float16 on CUDA devices.
+        backend: "huggingface" runs the model with sentence-transformers (PyTorch); "fastembed" runs a quantized
+            ONNX export of the model with FastEmbed, which is usually faster on CPU. FastEmbed only supports
+            the models listed by `fastembed.TextEmbedding.list_supported_models()` (e.g., "BAAI/bge-small-en-v1.5").
+    """
+    if backend == "huggingface":
+        from langchain_huggingface import HuggingFaceEmbeddings
+
+        model_kwargs = {"device": device}
+        if device.startswith("cuda"):
+            # Half precision roughly doubles embedding throughput on GPUs with no noticeable loss in quality.
+            model_kwargs["model_kwargs"] = {"torch_dtype": "float16"}
+        return HuggingFaceEmbeddings(
+            model_name=embedding_model,
+            model_kwargs=model_kwargs,
+            encode_kwargs={"normalize_embeddings": True},
+        )
+    if backend == "fastembed":
+        try:
+            from langchain_community.embeddings import FastEmbedEmbeddings
+        except ImportError:
+            raise ImportError(
+                "FastEmbed backend requires `pip install fastembed langchain-community`."
+            )
+
+        return FastEmbedEmbeddings(model_name=embedding_model)
+    raise ValueError(
+        "Invalid embedding backend. Please provide either 'huggingface' or 'fastembed'."
+    )
+
+
+class _EmbeddingCache:
+    """
+    On-disk cache of document embeddings keyed by the SHA-256 of the text and the embedding model name, backend and
+    dtype, since the same model gives slightly different vectors under each backend and precision.
+
+    Any database error is logged and treated as a cache miss so that ingestion never fails because of the cache.
+    """
+
+    def __init__(self, cache_path: str, model_name: str, backend: str, dtype: str):
+        self.model_key = (model_name, backend, dtype)
+        try:
+            self.conn = sqlite3.connect(cache_path)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(hash TEXT, model TEXT, backend TEXT, dtype TEXT, vector BLOB, "
+                "PRIMARY KEY (hash, model, backend, dtype))"
+            )
+        except sqlite3.Error as e:
+            logging.warning(
+                f"Embedding cache disabled, failed to open {cache_path}: {e}"
+            )
+            self.conn = None
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, hashes: List[str]) -> Dict[str, List[float]]:
+        if self.conn is None or not hashes:
+            return {}
+        found = {}
+        try:
+            # Stay below SQLite's default limit on the number of bound parameters.
+            for start in range(0, len(hashes), 900):
+                chunk = hashes[start : start + 900]
+                rows = self.conn.execute(
+                    f"SELECT hash, vector FROM embeddings "
+                    f"WHERE model = ? AND backend = ? AND dtype = ? "
+                    f"AND hash IN ({','.join('?' * len(chunk))})",
+                    [*self.model_key, *chunk],
+                )
+                for text_hash, blob in rows:
+                    vector = array.array("f")
+                    vector.frombytes(blob)
+                    found[text_hash] = vector.tolist()
+        except sqlite3.Error as e:
+            logging.warning(f"Embedding cache lookup failed: {e}")
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]):
+        if self.conn is None or not items:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(hash, model, backend, dtype, vector) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (text_hash, *self.model_key, array.array("f", vector).tobytes())
+                        for text_hash, vector in items.items()
+                    ],
+                )
+        except sqlite3.Error as e:
+            logging.warning(f"Embedding cache update failed: {e}")
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+def _read_csv(file_path: str, string_columns: List[str]):
+    """
+    Read a CSV corpus into a pandas DataFrame, using PyArrow's multithreaded parser when it is installed.
+
+    With PyArrow, `string_columns` are always read as strings (empty fields become "") so that values such as
+    a "2020-01-01" title are not turned into dates in the document metadata.
+    """
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(file_path)
+
+    return pa_csv.read_csv(
+        file_path,
+        # Documents often contain line breaks inside quoted fields, which PyArrow rejects by default.
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={column: pa.string() for column in string_columns}
+        ),
+    ).to_pandas()
+
+
 class QdrantVectorStoreManager:
     """
     Helper class for managing the Qdrant vector store, can be used with `VectorRM` in rm.py.
@@ -67,7 +237,12 @@ class QdrantVectorStoreManager:
 
     @staticmethod
     def _check_create_collection(
-        client: "QdrantClient", collection_name: str, model: "HuggingFaceEmbeddings"
+        client: "QdrantClient",
+        collection_name: str,
+        model: "HuggingFaceEmbeddings",
+        quantization: str = None,
+        on_disk: bool = False,
+        float16: bool = False,
     ):
         from langchain_qdrant import Qdrant
         from qdrant_client import models
@@ -87,11 +262,32 @@ class QdrantVectorStoreManager:
                 f"Collection {collection_name} does not exist. Creating the collection..."
             )
             # create the collection
+            if quantization == "scalar":
+                quantization_config = models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+                    )
+                )
+            elif quantization == "binary":
+                quantization_config = models.BinaryQuantization(
+                    binary=models.BinaryQuantizationConfig(always_ram=True)
+                )
+            elif quantization is None:
+                quantization_config = None
+            else:
+                raise ValueError(
+                    "Invalid quantization. Please provide either 'scalar', 'binary' or None."
+                )
+            # the vector size is inferred from the embedding model instead of being fixed to bge-m3's 1024
             client.create_collection(
                 collection_name=f"{collection_name}",
                 vectors_config=models.VectorParams(
-                    size=1024, distance=models.Distance.COSINE
+                    size=len(model.embed_query(collection_name)),
+                    distance=models.Distance.COSINE,
+                    on_disk=on_disk,
+                    datatype=models.Datatype.FLOAT16 if float16 else None,
                 ),
+                quantization_config=quantization_config,
             )
             return Qdrant(
                 client=client,
@@ -101,7 +297,13 @@ class QdrantVectorStoreManager:
 
     @staticmethod
     def _init_online_vector_db(
-        url: str, api_key: str, collection_name: str, model: "HuggingFaceEmbeddings"
+        url: str,
+        api_key: str,
+        collection_name: str,
+        model: "HuggingFaceEmbeddings",
+        quantization: str = None,
+        on_disk: bool = False,
+        float16: bool = False,
     ):
         from qdrant_client import QdrantClient
 
@@ -121,14 +323,24 @@ class QdrantVectorStoreManager:
         try:
             client = QdrantClient(url=url, api_key=api_key)
             return QdrantVectorStoreManager._check_create_collection(
-                client=client, collection_name=collection_name, model=model
+                client=client,
+                collection_name=collection_name,
+                model=model,
+                quantization=quantization,
+                on_disk=on_disk,
+                float16=float16,
             )
         except Exception as e:
             raise ValueError(f"Error occurs when connecting to the server: {e}")
 
     @staticmethod
     def _init_offline_vector_db(
-        vector_store_path: str, collection_name: str, model: "HuggingFaceEmbeddings"
+        vector_store_path: str,
+        collection_name: str,
+        model: "HuggingFaceEmbeddings",
+        quantization: str = None,
+        on_disk: bool = False,
+        float16: bool = False,
     ):
         from qdrant_client import QdrantClient
 
@@ -143,7 +355,12 @@ class QdrantVectorStoreManager:
         try:
             client = QdrantClient(path=vector_store_path)
             return QdrantVectorStoreManager._check_create_collection(
-                client=client, collection_name=collection_name, model=model
+                client=client,
+                collection_name=collection_name,
+                model=model,
+                quantization=quantization,
+                on_disk=on_disk,
+                float16=float16,
             )
         except Exception as e:
             raise ValueError(f"Error occurs when loading the vector store: {e}")
@@ -157,7 +374,7 @@ class QdrantVectorStoreManager:
         title_column: str = "title",
         url_column: str = "url",
         desc_column: str = "description",
-        batch_size: int = 64,
+        batch_size: int = 256,
         chunk_size: int = 500,
         chunk_overlap: int = 100,
         vector_store_path: str = None,
@@ -165,20 +382,25 @@ class QdrantVectorStoreManager:
         qdrant_api_key: str = None,
         embedding_model: str = "BAAI/bge-m3",
         device: str = "mps",
+        embedding_cache_path: str = None,
+        quantization: str = None,
+        embedding_backend: str = "huggingface",
+        on_disk: bool = False,
+        float16: bool = False,
     ):
         from qdrant_client import Document
 
         """
-        Takes a CSV file and adds each row in the CSV file to the Qdrant collection.
+        Takes a CSV (or Parquet) file and adds each row in the file to the Qdrant collection.
 
-        This function expects each row of the CSV file as a document.
-        The CSV file should have columns for "content", "title", "URL", and "description".
+        This function expects each row of the file as a document.
+        The file should have columns for "content", "title", "URL", and "description".
 
         Args:
             collection_name: Name of the Qdrant collection.
             vector_store_path (str): Path to the directory where the vector store is stored or will be stored.
             vector_db_mode (str): Mode of the Qdrant vector store (offline or online).
-            file_path (str): Path to the CSV file.
+            file_path (str): Path to the CSV or Parquet file.
             content_column (str): Name of the column containing the content.
             title_column (str): Name of the column containing the title. Default is "title".
             url_column (str): Name of the column containing the URL. Default is "url".
@@ -189,26 +411,33 @@ class QdrantVectorStoreManager:
             embedding_model: Name of the Hugging Face embedding model.
             device: Device to run the embeddings model on, can be "mps", "cuda", "cpu".
             qdrant_api_key: API key for the Qdrant server (Only required if the Qdrant server is online).
+            embedding_cache_path: Path to a SQLite file caching document embeddings across runs. If provided,
+                only chunks whose text has not been embedded with the same model, backend and dtype before are
+                sent to the model.
+            quantization: Quantization applied when creating a new collection, either "scalar" (int8), "binary" or
+                None. Quantized vectors are kept in RAM for search while the original vectors are used for rescoring.
+                Only takes effect on a Qdrant server; the local offline store always searches full vectors.
+            embedding_backend: "huggingface" (sentence-transformers) or "fastembed" (ONNX). See `load_embedding_model`.
+            on_disk: Whether to keep the original vectors of a new collection memory-mapped on disk instead of in RAM.
+                Lowers memory usage for large corpora at the cost of slower search (pair it with quantization to
+                keep searching in RAM). Only takes effect on a Qdrant server.
+            float16: Whether to store the vectors of a new collection as float16 instead of float32, halving their
+                storage with negligible loss in retrieval quality for normalized embeddings. Only takes effect on a
+                Qdrant server; the local offline store ignores the vector datatype.
         """
         # check if the collection name is provided
         if collection_name is None:
             raise ValueError("Please provide a collection name.")
 
-        model_kwargs = {"device": device}
-        encode_kwargs = {"normalize_embeddings": True}
-        from langchain_huggingface import HuggingFaceEmbeddings
-
-        model = HuggingFaceEmbeddings(
-            model_name=embedding_model,
-            model_kwargs=model_kwargs,
-            encode_kwargs=encode_kwargs,
-        )
+        model = load_embedding_model(embedding_model, device, embedding_backend)
 
         if file_path is None:
             raise ValueError("Please provide a file path.")
-        # check if the file is a csv file
-        if not file_path.endswith(".csv"):
-            raise ValueError(f"Not valid file format. Please provide a csv file.")
+        # check if the file is a csv or parquet file
+        if not file_path.endswith((".csv", ".parquet")):
+            raise ValueError(
+                f"Not valid file format. Please provide a csv or parquet file."
+            )
         if content_column is None:
             raise ValueError("Please provide the name of the content column.")
         if url_column is None:
@@ -222,12 +451,23 @@ class QdrantVectorStoreManager:
                 api_key=qdrant_api_key,
                 collection_name=collection_name,
                 model=model,
+                quantization=quantization,
+                on_disk=on_disk,
+                float16=float16,
             )
         elif vector_db_mode == "offline":
+            if float16:
+                logging.warning(
+                    "float16 vectors are only supported on a Qdrant server; "
+                    "the offline vector store keeps float32 vectors."
+                )
             qdrant = QdrantVectorStoreManager._init_offline_vector_db(
                 vector_store_path=vector_store_path,
                 collection_name=collection_name,
                 model=model,
+                quantization=quantization,
+                on_disk=on_disk,
+                float16=float16,
             )
         else:
             raise ValueError(
@@ -236,10 +476,15 @@ class QdrantVectorStoreManager:
         if qdrant is None:
             raise ValueError("Qdrant client is not initialized.")
 
-        # read the csv file
+        # read the csv / parquet file
         import pandas as pd
 
-        df = pd.read_csv(file_path)
+        if file_path.endswith(".parquet"):
+            df = pd.read_parquet(file_path)
+        else:
+            df = _read_csv(
+                file_path, [content_column, title_column, url_column, desc_column]
+            )
         # check that content column exists and url column exists
         if content_column not in df.columns:
             raise ValueError(
@@ -283,17 +528,110 @@ class QdrantVectorStoreManager:
             ],
         )
         split_documents = text_splitter.split_documents(documents)
+        # Group chunks of similar length into the same batch so that little compute is spent on padding tokens.
+        # Each point carries its own payload, so the insertion order does not matter.
+        split_documents.sort(key=lambda document: len(document.page_content))
 
         # update and save the vector store
-        num_batches = (len(split_documents) + batch_size - 1) // batch_size
-        for i in tqdm(range(num_batches)):
-            start_idx = i * batch_size
-            end_idx = min((i + 1) * batch_size, len(split_documents))
-            qdrant.add_documents(
-                documents=split_documents[start_idx:end_idx],
-                batch_size=batch_size,
+        # Embed the next batch while the previous one is written to Qdrant in the background.
+        from qdrant_client import models
+
+        def upsert_batch(batch_documents, batch_embeddings, wait):
+            qdrant.client.upsert(
+                collection_name=collection_name,
+                points=[
+                    models.PointStruct(
+                        id=uuid.uuid4().hex,
+                        vector=embedding,
+                        payload={
+                            qdrant.content_payload_key: document.page_content,
+                            qdrant.metadata_payload_key: document.metadata,
+                        },
+                    )
+                    for document, embedding in zip(batch_documents, batch_embeddings)
+                ],
+                # Only the last write blocks during bulk ingestion; Qdrant applies them in order, so once it is
+                # acknowledged all points are searchable.
+                wait=wait,
+            )
+
+        embedding_cache = (
+            _EmbeddingCache(
+                embedding_cache_path,
+                embedding_model,
+                embedding_backend,
+                # Mirrors `load_embedding_model`, which runs the model in float16 on CUDA.
+                (
+                    "float16"
+                    if embedding_backend == "huggingface" and device.startswith("cuda")
+                    else "float32"
+                ),
+            )
+            if embedding_cache_path
+            else None
+        )
+
+        def embed_documents(batch_documents):
+            texts = [document.page_content for document in batch_documents]
+            if embedding_cache is None:
+                return model.embed_documents(texts)
+            hashes = [_EmbeddingCache.hash_text(text) for text in texts]
+            cached = embedding_cache.get_many(hashes)
+            missing = {}
+            for text_hash, text in zip(hashes, texts):
+                if text_hash not in cached:
+                    missing.setdefault(text_hash, text)
+            if missing:
+                new_embeddings = dict(
+                    zip(missing, model.embed_documents(list(missing.values())))
+                )
+                embedding_cache.put_many(new_embeddings)
+                cached.update(new_embeddings)
+            return [cached[text_hash] for text_hash in hashes]
+
+        # On a Qdrant server, pause HNSW indexing during the bulk upload and build the index once afterwards
+        # instead of updating it incrementally with every batch.
+        indexing_threshold = None
+        if vector_db_mode == "online":
+            indexing_threshold = qdrant.client.get_collection(
+                collection_name=collection_name
+            ).config.optimizer_config.indexing_threshold
+        if indexing_threshold:
+            qdrant.client.update_collection(
+                collection_name=collection_name,
+                optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
             )
 
+        num_batches = (len(split_documents) + batch_size - 1) // batch_size
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                pending_upsert = None
+                for i in tqdm(range(num_batches)):
+                    start_idx = i * batch_size
+                    end_idx = min((i + 1) * batch_size, len(split_documents))
+                    batch_documents = split_documents[start_idx:end_idx]
+                    batch_embeddings = embed_documents(batch_documents)
+                    if pending_upsert is not None:
+                        pending_upsert.result()
+                    pending_upsert = executor.submit(
+                        upsert_batch,
+                        batch_documents,
+                        batch_embeddings,
+                        wait=i == num_batches - 1,
+                    )
+                if pending_upsert is not None:
+                    pending_upsert.result()
+        finally:
+            if indexing_threshold:
+                qdrant.client.update_collection(
+                    collection_name=collection_name,
+                    optimizers_config=models.OptimizersConfigDiff(
+                        indexing_threshold=indexing_threshold
+                    ),
+                )
+
+        if embedding_cache is not None:
+            embedding_cache.close()
         # close the qdrant client
         qdrant.client.close()
 
@@ -317,21 +655,17 @@ class ArticleTextProcessing:
         """
 
         word_count = 0
-        limited_string = ""
-
-        for word in input_string.split("\n"):
-            line_words = word.split()
-            for lw in line_words:
-                if word_count < max_word_count:
-                    limited_string += lw + " "
-                    word_count += 1
-                else:
-                    break
+        limited_lines = []
+
+        for line in input_string.split("\n"):
+            line_words = line.split()[: max(max_word_count - word_count, 0)]
+            if line_words:
+                limited_lines.append(" ".join(line_words))
+                word_count += len(line_words)
             if word_count >= max_word_count:
                 break
-            limited_string = limited_string.strip() + "\n"
 
-        return limited_string.strip()
+        return "\n".join(limited_lines)
 
     @staticmethod
     def remove_citations(s):
@@ -415,11 +749,10 @@ class ArticleTextProcessing:
         # if trailing_citations:
         #     combined_sentences += ' '.join(trailing_citations)
 
-        # Regex pattern to match sentence endings, including optional citation markers.
-        eos_pattern = r"([.!?])\s*(\[\d+\])?\s*"
-        matches = list(re.finditer(eos_pattern, text))
-        if matches:
-            last_match = matches[-1]
+        last_match = None
+        for last_match in _EOS_PATTERN.finditer(text):
+            pass
+        if last_match is not None:
             text = text[: last_match.end()].strip()
 
         return text
@@ -478,28 +811,12 @@ class ArticleTextProcessing:
         outline = "\n".join(output_lines)
 
         # Remove references.
-        outline = re.sub(r"#[#]? See also.*?(?=##|$)", "", outline, flags=re.DOTALL)
-        outline = re.sub(r"#[#]? See Also.*?(?=##|$)", "", outline, flags=re.DOTALL)
-        outline = re.sub(r"#[#]? Notes.*?(?=##|$)", "", outline, flags=re.DOTALL)
-        outline = re.sub(r"#[#]? References.*?(?=##|$)", "", outline, flags=re.DOTALL)
-        outline = re.sub(
-            r"#[#]? External links.*?(?=##|$)", "", outline, flags=re.DOTALL
-        )
-        outline = re.sub(
-            r"#[#]? External Links.*?(?=##|$)", "", outline, flags=re.DOTALL
-        )
-        outline = re.sub(r"#[#]? Bibliography.*?(?=##|$)", "", outline, flags=re.DOTALL)
-        outline = re.sub(
-            r"#[#]? Further reading*?(?=##|$)", "", outline, flags=re.DOTALL
-        )
-        outline = re.sub(
-            r"#[#]? Further Reading*?(?=##|$)", "", outline, flags=re.DOTALL
-        )
-        outline = re.sub(r"#[#]? Summary.*?(?=##|$)", "", outline, flags=re.DOTALL)
-        outline = re.sub(r"#[#]? Appendices.*?(?=##|$)", "", outline, flags=re.DOTALL)
-        outline = re.sub(r"#[#]? Appendix.*?(?=##|$)", "", outline, flags=re.DOTALL)
+        for pattern in _OUTLINE_REFERENCE_SECTION_PATTERNS:
+            if "#" not in outline:
+                break
+            outline = pattern.sub("", outline)
         # clean up citation in outline
-        outline = re.sub(r"\[.*?\]", "", outline)
+        outline = _BRACKET_PATTERN.sub("", outline)
         return outline
 
     @staticmethod
@@ -540,14 +857,16 @@ class ArticleTextProcessing:
     @staticmethod
     def update_citation_index(s, citation_map):
         """Update citation index in the string based on the citation map."""
-        for original_citation in citation_map:
-            s = s.replace(
-                f"[{original_citation}]", f"__PLACEHOLDER_{original_citation}__"
-            )
-        for original_citation, unify_citation in citation_map.items():
-            s = s.replace(f"__PLACEHOLDER_{original_citation}__", f"[{unify_citation}]")
-
-        return s
+        if not citation_map:
+            return s
+        # Rewrite all citations in a single pass so remapped indices are never rewritten twice.
+        str_citation_map = {
+            str(original_citation): f"[{unify_citation}]"
+            for original_citation, unify_citation in citation_map.items()
+        }
+        return _CITATION_PATTERN.sub(
+            lambda match: str_citation_map.get(match.group(1), match.group(0)), s
+        )
 
     @staticmethod
     def parse_article_into_dict(input_string):
@@ -596,16 +915,76 @@ class ArticleTextProcessing:
 
 class FileIOHelper:
     @staticmethod
-    def dump_json(obj, file_name, encoding="utf-8"):
+    def dump_json(obj, file_name, encoding="utf-8", indent=None):
+        """
+        Write `obj` to `file_name` as JSON. Values that cannot be serialized are written as
+        "non-serializable contents" instead of raising.
+
+        With orjson, NaN and infinite floats are written as null (json writes NaN/Infinity literals) and non-ASCII
+        text is written as raw UTF-8 instead of \\u escapes.
+        """
+        # orjson (if installed) is much faster than json for the large logs dumped after each run.
+        # orjson only supports 2-space indentation; other values are handled by json below.
+        if (
+            orjson is not None
+            and encoding.lower() in ("utf-8", "utf8")
+            and indent in (None, 2)
+        ):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            try:
+                data = orjson.dumps(
+                    obj,
+                    default=FileIOHelper._orjson_default,
+                    option=option,
+                )
+            except TypeError:
+                pass  # e.g., integers out of 64-bit range; fall back to json below
+            else:
+                with open(file_name, "wb") as fw:
+                    fw.write(data)
+                return
+        with open(file_name, "w", encoding=encoding) as fw:
+            json.dump(
+                obj, fw, default=FileIOHelper.handle_non_serializable, indent=indent
+            )
+
+    @staticmethod
+    def dump_jsonl(objs, file_name, encoding="utf-8"):
+        if orjson is not None and encoding.lower() in ("utf-8", "utf8"):
+            with open(file_name, "wb") as fw:
+                for obj in objs:
+                    try:
+                        fw.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
+                    except TypeError:
+                        fw.write((json.dumps(obj) + "\n").encode("utf-8"))
+            return
         with open(file_name, "w", encoding=encoding) as fw:
-            json.dump(obj, fw, default=FileIOHelper.handle_non_serializable)
+            for obj in objs:
+                fw.write(json.dumps(obj) + "\n")
 
     @staticmethod
     def handle_non_serializable(obj):
         return "non-serializable contents"  # mark the non-serializable part
 
+    @staticmethod
+    def _orjson_default(obj):
+        # json writes float subclasses (e.g., numpy.float64) as numbers; orjson does not.
+        if isinstance(obj, float):
+            return float(obj)
+        return FileIOHelper.handle_non_serializable(obj)
+
     @staticmethod
     def load_json(file_name, encoding="utf-8"):
+        if orjson is not None and encoding.lower() in ("utf-8", "utf8"):
+            with open(file_name, "rb") as fr:
+                data = fr.read()
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # e.g., NaN/Infinity literals written by json.dump
+                return json.loads(data.decode(encoding))
         with open(file_name, "r", encoding=encoding) as fr:
             return json.load(fr)
 
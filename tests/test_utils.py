@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from knowledge_storm.utils import _read_csv
+
+
+def test_read_csv_keeps_metadata_columns_as_strings(tmp_path):
+    file_path = tmp_path / "corpus.csv"
+    file_path.write_text(
+        "content,title,url,description\n"
+        '"first line\nsecond line",2020-01-01,https://example.com,\n',
+        encoding="utf-8",
+    )
+
+    df = _read_csv(str(file_path), ["content", "title", "url", "description"])
+
+    assert df.to_dict(orient="records") == [
+        {
+            "content": "first line\nsecond line",
+            "title": "2020-01-01",
+            "url": "https://example.com",
+            "description": "",
+        }
+    ]